@@ -1,6 +1,8 @@
 from scipy.stats import truncnorm
 from random import choices
 from time import time
+from collections import OrderedDict
+import sys
 
 from json import load, dump
 import os
@@ -39,6 +41,14 @@ class Words:
         with open(self.freqs_file) as file:
             self.freqs = load(file)
 
+        # LRU cache of get_words() results, bounded by approximate total size in bytes
+        self.cache_max_bytes = 64 * 2**20
+        self.cache = OrderedDict()  # query key: (tuple of words, size in bytes)
+        self.cache_bytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_corpus = None  # corpus signature the cached results were computed with
+
     def read_scowl(self, file):
         """ Read data from a SCOWL file if it exists """
         words = []
@@ -123,12 +133,32 @@ class Words:
         <allowed> is an optional string/list/set of allowed letters.
         <vowel_required> only return words with at least one vowel.
         """
+        key = self.query_key(min_level, max_level, min_length, max_length, allowed, vowel_required)
+        self.check_corpus()
+        if key in self.cache:
+            self.cache_hits += 1
+            self.cache.move_to_end(key)
+            return list(self.cache[key][0])
+
+        self.cache_misses += 1
+        words = self.filter_words(*key)
+        self.cache_store(key, words)
+        return list(words)
+
+    def query_key(self, min_level, max_level, min_length, max_length, allowed, vowel_required):
+        """
+        Normalize get_words() arguments into a hashable key,
+        so equivalent queries (e.g. <allowed> as a string, list or set) share a cache entry.
+        """
         if min_level is None: min_level = self.min
         if max_level is None: max_level = self.max
-        if allowed is None: allowed = self.allowed_letters
-        else: allowed = set(let.lower() for let in allowed)  # ensure lowercase
         assert self.min <= min_level <= max_level <= self.max, f"Got: {min_level}, {max_level}"
+        if allowed is None: allowed = self.allowed_letters
+        allowed = frozenset(let.lower() for let in allowed)  # ensure lowercase
+        return min_level, max_level, min_length or None, max_length or None, allowed, bool(vowel_required)
 
+    def filter_words(self, min_level, max_level, min_length, max_length, allowed, vowel_required):
+        """ Read and filter words from the SCOWL database. Arguments must be normalized by query_key() """
         words = []
         for file in self.scowl_categories:
             for level in range(min_level, max_level+1):  # indexes
@@ -136,7 +166,9 @@ class Words:
                 words += self.read_scowl(f"{file}.{scowl_level}")
 
         # filter
-        offensive = self.read_scowl(self.offensive)
+        offensive = set()
+        for file in self.offensive:
+            offensive.update(self.read_scowl(file))
         filtered = []
         for word in words:
             word = word.lower().strip()
@@ -155,7 +187,45 @@ class Words:
                 continue
             filtered.append(word)
 
-        return filtered
+        return tuple(filtered)
+
+    def corpus_signature(self):
+        """ Hashable snapshot of the settings that determine which words are in the corpus """
+        return (self.scowl_dir, tuple(self.scowl_categories), tuple(self.offensive),
+                tuple(self.scowl_levels), frozenset(self.vowels))
+
+    def check_corpus(self):
+        """ Clear the cache if the corpus or exclusion lists changed since results were cached """
+        signature = self.corpus_signature()
+        if signature != self.cache_corpus:
+            self.clear_cache()
+            self.cache_corpus = signature
+
+    def clear_cache(self):
+        """ Remove all cached get_words() results. Call this if the SCOWL files change on disk """
+        self.cache.clear()
+        self.cache_bytes = 0
+
+    def cache_store(self, key, words):
+        """ Add a result to the cache, evicting the least recently used results to stay within self.cache_max_bytes """
+        size = sys.getsizeof(words) + sum(sys.getsizeof(word) for word in words)  # approximate
+        if size > self.cache_max_bytes:  # would evict everything else and still not fit
+            return
+        self.cache[key] = (words, size)
+        self.cache_bytes += size
+        while self.cache_bytes > self.cache_max_bytes:
+            _, (_, evicted) = self.cache.popitem(last=False)
+            self.cache_bytes -= evicted
+
+    def cache_info(self):
+        """ Return a dict of cache statistics """
+        return {
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'entries': len(self.cache),
+            'bytes': self.cache_bytes,
+            'max_bytes': self.cache_max_bytes,
+        }
 
     def get_random_word(self, min_level=None, max_level=None, mean_level=None, std=1, **kwargs):
         """
@@ -179,7 +249,7 @@ class Words:
         for _ in range(len(levels)):  # only iterate for as many levels
             level = choices(levels, weights=weights)[0]  # choose level
 
-            # get words from that level
+            # get words from that level (cached after the first draw)
             words = self.get_words(level, level, **kwargs)
 
             if len(words) > 0:  # if at least one word found
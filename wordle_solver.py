@@ -0,0 +1,215 @@
+from collections import Counter
+
+from scowl import Words
+
+
+# Feedback characters for each tile of a guess
+CORRECT = 'g'  # green: right letter, right spot
+PRESENT = 'y'  # yellow: letter is in the word, but in a different spot
+ABSENT = '-'  # gray: letter is not in the word (or not any more times than already marked)
+
+
+def to_bitset(indices):
+    """ Build an int bitset with the bit at each of the given <indices> set """
+    indices = list(indices)
+    if not indices:
+        return 0
+    data = bytearray(max(indices)//8 + 1)
+    for i in indices:
+        data[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(data, 'little')
+
+
+def score(guess, answer):
+    """
+    Return the feedback string Wordle gives for <guess> against <answer>.
+    Greens are assigned first, then yellows from the remaining letter counts left to right.
+    """
+    assert len(guess) == len(answer), f"Guess and answer must be the same length, got '{guess}' and '{answer}'"
+    feedback = [ABSENT]*len(guess)
+    remaining = Counter()
+    for i, (g, a) in enumerate(zip(guess, answer)):
+        if g == a:
+            feedback[i] = CORRECT
+        else:
+            remaining[a] += 1
+
+    for i, g in enumerate(guess):
+        if feedback[i] != CORRECT and remaining[g] > 0:
+            feedback[i] = PRESENT
+            remaining[g] -= 1
+    return ''.join(feedback)
+
+
+class LengthIndex:
+    """
+    Precomputed bitsets over all candidate words of a single length.
+    Bit i of each bitset corresponds to self.words[i].
+    """
+    def __init__(self, words, length):
+        self.length = length
+        self.words = sorted(set(words))
+        assert all(len(word) == self.length for word in self.words), f"All words must be of length {self.length}"
+        self.all = to_bitset(range(len(self.words)))
+
+        at = {}  # (position, letter): indices of words with <letter> at <position>
+        count = {}  # (letter, k): indices of words with at least k of <letter>
+        for i, word in enumerate(self.words):
+            for pos, letter in enumerate(word):
+                at.setdefault((pos, letter), []).append(i)
+            for letter, num in Counter(word).items():
+                for k in range(1, num+1):
+                    count.setdefault((letter, k), []).append(i)
+
+        self.at = {key: to_bitset(indices) for key, indices in at.items()}
+        self.not_at = {key: self.all & ~bits for key, bits in self.at.items()}
+        self.count = {key: to_bitset(indices) for key, indices in count.items()}
+
+    def __len__(self):
+        return len(self.words)
+
+    def letter_at(self, pos, letter):
+        """ Bitset of words with <letter> at position <pos> """
+        return self.at.get((pos, letter), 0)
+
+    def letter_not_at(self, pos, letter):
+        """ Bitset of words without <letter> at position <pos> """
+        return self.not_at.get((pos, letter), self.all)
+
+    def count_at_least(self, letter, k):
+        """ Bitset of words containing <letter> at least <k> times """
+        if k <= 0:
+            return self.all
+        return self.count.get((letter, k), 0)
+
+    def decode(self, bits):
+        """ Return the list of words whose bits are set in <bits>, in sorted order """
+        words = []
+        while bits:
+            low = bits & -bits  # lowest set bit
+            words.append(self.words[low.bit_length()-1])
+            bits ^= low
+        return words
+
+
+class Candidates:
+    """
+    The set of possible answers for one game, narrowed by each (guess, feedback) pair.
+    Each update only intersects bitsets with the current candidate mask.
+    Use WordleIndex.new_game() to create.
+    """
+    def __init__(self, index, hard_mode=False):
+        self.index = index  # LengthIndex for this game's word length
+        self.length = index.length
+        self.hard_mode = hard_mode
+        self.mask = index.all  # bitset of remaining candidates
+        self.history = []  # list of (guess, feedback) pairs
+
+        # revealed hints, tracked for hard mode
+        self.greens = {}  # position: letter
+        self.min_counts = {}  # letter: minimum number of occurrences
+
+    def __len__(self):
+        return bin(self.mask).count('1')
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def __contains__(self, word):
+        return word in self.words
+
+    @property
+    def words(self):
+        """ List of the remaining candidate words """
+        return self.index.decode(self.mask)
+
+    def check_hard_mode(self, guess):
+        """ Return an error message if <guess> doesn't use all revealed hints, otherwise None """
+        for pos, letter in sorted(self.greens.items()):
+            if guess[pos] != letter:
+                return f"Letter {pos+1} must be {letter.upper()}"
+        counts = Counter(guess)
+        for letter, num in sorted(self.min_counts.items()):
+            if counts[letter] < num:
+                return f"Guess must contain {letter.upper()}" + (f" {num} times" if num > 1 else "")
+        return None
+
+    def update(self, guess, feedback):
+        """
+        Narrow the candidates with the <feedback> string given for <guess>.
+        <feedback> has one character per letter: CORRECT, PRESENT or ABSENT.
+        Returns the number of remaining candidates.
+        """
+        guess = guess.lower().strip()
+        feedback = feedback.lower().strip()
+        assert len(guess) == self.length, f"Guess must be {self.length} letters, got '{guess}'"
+        assert len(feedback) == self.length, f"Feedback must be {self.length} characters, got '{feedback}'"
+        assert set(feedback).issubset({CORRECT, PRESENT, ABSENT}), \
+            f"Feedback must only contain '{CORRECT}', '{PRESENT}' or '{ABSENT}', got '{feedback}'"
+        if self.hard_mode:
+            error = self.check_hard_mode(guess)
+            assert error is None, f"Hard mode: {error}"
+
+        index = self.index
+        mask = self.mask
+        found = Counter()  # letter: number of green/yellow tiles
+        capped = set()  # letters with a gray tile, so their count is exact
+        for pos, (letter, mark) in enumerate(zip(guess, feedback)):
+            if mark == CORRECT:
+                mask &= index.letter_at(pos, letter)
+                found[letter] += 1
+                self.greens[pos] = letter
+            else:
+                mask &= index.letter_not_at(pos, letter)
+                if mark == PRESENT:
+                    found[letter] += 1
+                else:
+                    capped.add(letter)
+
+        for letter in set(guess):
+            num = found[letter]
+            mask &= index.count_at_least(letter, num)
+            if letter in capped:  # no more than <num> of this letter
+                mask &= ~index.count_at_least(letter, num+1)
+            if num > self.min_counts.get(letter, 0):
+                self.min_counts[letter] = num
+
+        self.mask = mask
+        self.history.append((guess, feedback))
+        return len(self)
+
+
+class WordleIndex:
+    """
+    Per-length candidate indexes for a variable-length Wordle variant.
+    Words are drawn from the SCOWL database through Words.get_words(),
+    unless a list of <words> is given directly.
+    """
+    def __init__(self, words=None, min_length=4, max_length=8, min_level=None, max_level=None):
+        assert 0 < min_length <= max_length, f"Got: {min_length}, {max_length}"
+        self.min_length = min_length
+        self.max_length = max_length
+
+        if words is None:
+            words = Words().get_words(min_level=min_level, max_level=max_level,
+                                      min_length=min_length, max_length=max_length)
+
+        by_length = {length: [] for length in range(min_length, max_length+1)}
+        for word in words:
+            word = word.lower().strip()
+            if word.isalpha() and word.isascii() and len(word) in by_length:
+                by_length[len(word)].append(word)
+
+        self.indexes = {length: LengthIndex(group, length) for length, group in by_length.items()}
+
+    def new_game(self, length, hard_mode=False):
+        """ Start a new set of candidates for words of the given <length> """
+        assert length in self.indexes, f"Length must be between {self.min_length} and {self.max_length}, got {length}"
+        return Candidates(self.indexes[length], hard_mode=hard_mode)
+
+    def filter(self, length, history, hard_mode=False):
+        """ Return the candidate words of <length> consistent with a <history> of (guess, feedback) pairs """
+        game = self.new_game(length, hard_mode=hard_mode)
+        for guess, feedback in history:
+            game.update(guess, feedback)
+        return game.words